@@ -1,5 +1,12 @@
+from functools import lru_cache
 from yfinance import Ticker
 
-def get_bank_data(ticker):
+@lru_cache(maxsize=None)
+def _bank_statements(ticker):
     bank = Ticker(ticker)
     return bank.financials.transpose(), bank.balance_sheet.transpose()
+
+def get_bank_data(ticker):
+    # Copies : les DataFrames mémoïsés ne sont jamais partagés entre appelants
+    financials, balance_sheet = _bank_statements(ticker)
+    return financials.copy(), balance_sheet.copy()
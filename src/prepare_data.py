@@ -4,8 +4,12 @@ Ce script charge les données depuis yfinance et les sauvegarde pour le dashboar
 """
 
 import yfinance as yf
+import numpy as np
 import pandas as pd
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
 
 warnings.filterwarnings('ignore')
 
@@ -16,36 +20,55 @@ TICKERS = {
     "Crédit Agricole": "ACA.PA"
 }
 
-def load_bank_financials(bank_name, ticker_symbol):
+INCOME_KEYS = [
+    "Total Revenue",
+    "Net Income"
+]
+
+BALANCE_KEYS = [
+    "Total Assets",
+    "Total Liabilities Net Minority Interest",
+    "Stockholders Equity"
+]
+
+# Cache disque des états financiers : un fichier par ticker et par jour
+CACHE_DIR = "data/.cache"
+
+def _cached_fetch(ticker):
+    """
+    États financiers retenus d'un ticker (une ligne par date de clôture),
+    lus depuis le cache du jour s'il existe, sinon téléchargés puis mis en cache
+    """
+    cache_path = os.path.join(CACHE_DIR, f"{ticker.ticker}_{date.today():%Y%m%d}.parquet")
+    if os.path.exists(cache_path):
+        return pd.read_parquet(cache_path)
+
+    # Transposition des états complets puis sélection des colonnes retenues ;
+    # reindex : une ligne absente devient une colonne NaN (lignes écartées par dropna
+    # dans main) au lieu d'une KeyError qui ferait perdre tout le ticker
+    income_selected = ticker.income_stmt.T.reindex(columns=INCOME_KEYS)
+    balance_selected = ticker.balance_sheet.T.reindex(columns=BALANCE_KEYS)
+
+    # Jointure interne : les dates absentes d'un des états seraient écartées par dropna
+    statements = income_selected.join(balance_selected, how="inner").dropna(how="all")
+
+    # Pas de cache pour un téléchargement vide (réseau ou ticker indisponible)
+    if not statements.empty:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        statements.to_parquet(cache_path, compression="zstd")
+    return statements
+
+def load_bank_financials(bank_name, ticker):
     """
     Charge les données financières d'une banque depuis Yahoo Finance
     """
     print(f"Chargement des données pour {bank_name}...")
-    ticker = yf.Ticker(ticker_symbol)
-
-    income_stmt = ticker.income_stmt
-    balance_sheet = ticker.balance_sheet
-
-    income_keys = [
-        "Total Revenue",
-        "Net Income"
-    ]
-
-    balance_keys = [
-        "Total Assets",
-        "Total Liabilities Net Minority Interest",
-        "Stockholders Equity"
-    ]
-
-    income_selected = income_stmt.loc[income_keys]
-    balance_selected = balance_sheet.loc[balance_keys]
-
-    df = pd.concat(
-        [income_selected.T, balance_selected.T],
-        axis=1
-    )
+    df = _cached_fetch(ticker)
+    if df.empty:
+        raise ValueError(f"aucune donnée financière pour {ticker.ticker}")
 
-    df["bank"] = bank_name
+    # Catégories triées : codes entiers pour les groupby, ordre alphabétique conservé au tri
+    df["bank"] = pd.Categorical([bank_name] * len(df), categories=sorted(TICKERS))
     return df
 
 def calculate_metrics(df):
@@ -54,26 +77,25 @@ def calculate_metrics(df):
     """
     print("Calcul des métriques financières...")
     
-    # Ratios de performance
-    df["leverage_ratio"] = (
-        df["Total Liabilities Net Minority Interest"] / df["Stockholders Equity"]
-    )
-    
-    df["roe"] = (
-        df["Net Income"] / df["Stockholders Equity"]
-    )
-    
-    df["roa"] = (
-        df["Net Income"] / df["Total Assets"]
-    )
-    
-    # Marges bénéficiaires
-    df["profit_margin"] = (df["Net Income"] / df["Total Revenue"]) * 100
-    
-    # Ratio de capitaux propres
-    df["equity_ratio"] = (df["Stockholders Equity"] / df["Total Assets"]) * 100
-    
-    return df
+    tr = df["Total Revenue"].to_numpy()
+    ni = df["Net Income"].to_numpy()
+    ta = df["Total Assets"].to_numpy()
+    tl = df["Total Liabilities Net Minority Interest"].to_numpy()
+    se = df["Stockholders Equity"].to_numpy()
+
+    # Divisions directement sur les tableaux numpy, colonnes ajoutées en une fois
+    # (un dénominateur nul donne inf/NaN comme avant, sans avertissement)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return df.assign(
+            # Ratios de performance
+            leverage_ratio=tl / se,
+            roe=ni / se,
+            roa=ni / ta,
+            # Marges bénéficiaires
+            profit_margin=ni / tr * 100,
+            # Ratio de capitaux propres
+            equity_ratio=se / ta * 100
+        )
 
 def calculate_growth_rates(df):
     """
@@ -82,19 +104,12 @@ def calculate_growth_rates(df):
     print("Calcul des taux de croissance...")
     
     df_sorted = df.sort_values(["bank", "year"]).reset_index(drop=True)
-    growth_metrics = []
+    grouped = df_sorted.groupby("bank", sort=False, observed=True)
 
-    for bank in df_sorted["bank"].unique():
-        bank_data = df_sorted[df_sorted["bank"] == bank].copy()
-        
-        bank_data["revenue_growth"] = bank_data["Total Revenue"].pct_change() * 100
-        bank_data["net_income_growth"] = bank_data["Net Income"].pct_change() * 100
-        bank_data["assets_growth"] = bank_data["Total Assets"].pct_change() * 100
-        
-        growth_metrics.append(bank_data)
-
-    df_growth = pd.concat(growth_metrics)
-    return df_growth
+    df_sorted[["revenue_growth", "net_income_growth", "assets_growth"]] = (
+        grouped[["Total Revenue", "Net Income", "Total Assets"]].pct_change() * 100
+    )
+    return df_sorted
 
 def main():
     """
@@ -105,22 +120,28 @@ def main():
     print("=" * 60)
     
     # Chargement des données pour toutes les banques
+    # (objets Ticker créés en un lot avant le lancement des threads, session HTTP
+    # partagée ; téléchargements indépendants et limités par le réseau : un thread par ticker)
+    tickers = yf.Tickers(list(TICKERS.values())).tickers
     dfs = []
-    for bank, ticker in TICKERS.items():
-        try:
-            df_bank = load_bank_financials(bank, ticker)
-            dfs.append(df_bank)
-        except Exception as e:
-            print(f"Erreur lors du chargement de {bank}: {e}")
+    with ThreadPoolExecutor(max_workers=len(TICKERS)) as executor:
+        futures = {
+            executor.submit(load_bank_financials, bank, tickers[symbol]): bank
+            for bank, symbol in TICKERS.items()
+        }
+        for future in as_completed(futures):
+            try:
+                dfs.append(future.result())
+            except Exception as e:
+                print(f"Erreur lors du chargement de {futures[future]}: {e}")
     
     # Consolidation
     print("\nConsolidation des données...")
-    df_all = pd.concat(dfs)
-    df = df_all.dropna().copy()
+    df = pd.concat(dfs).dropna()
     
     # Conversion des dates
     df.index = pd.to_datetime(df.index)
-    df["year"] = df.index.year
+    df["year"] = df.index.year.astype(np.int16)
     
     # Calcul des métriques
     df = calculate_metrics(df)